@@ -1,19 +1,52 @@
-from fastapi import FastAPI, HTTPException
+import argparse
+import asyncio
+import itertools
+import os
+import re
+import sys
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from pydantic import BaseModel
-from typing import List, Optional, Dict, Any
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, model_validator
+from pydantic_core import PydanticCustomError
+from typing import List, Optional, Dict, Any, Iterator, Set, Tuple
 from langchain.text_splitter import CharacterTextSplitter, RecursiveCharacterTextSplitter
-import uvicorn
+import numpy as np
+import orjson
+import xxhash
+
+app = FastAPI(
+    title="Chunk2Viz API",
+    description="Text chunking visualization API",
+    default_response_class=ORJSONResponse,
+)
+
+# Thread pool for CPU-bound splitting so the event loop stays responsive
+SPLIT_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
+# Upper bound on the number of texts accepted by one /chunk_batch request
+MAX_BATCH_ITEMS = 100
 
-app = FastAPI(title="Chunk2Viz API", description="Text chunking visualization API")
+# LRU cache of serialized /chunk responses, keyed on the request parameters.
+# Bounded by entry count and total bytes; oversized responses are never cached.
+RESPONSE_CACHE_SIZE = 256
+RESPONSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+RESPONSE_CACHE_MAX_ENTRY_BYTES = 1024 * 1024
+_response_cache: "OrderedDict[Tuple[Any, ...], bytes]" = OrderedDict()
+_response_cache_bytes = 0
 
 # Add CORS middleware
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["http://localhost:3000"],  # React dev server
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("GET", "POST", "OPTIONS"),
+    allow_headers=("Content-Type",),
+    max_age=86400,  # Let browsers cache preflight responses for a day
 )
 
 # Pydantic models
@@ -24,6 +57,31 @@ class ChunkRequest(BaseModel):
     splitter_type: str
     language: Optional[str] = None
 
+    # PydanticCustomError keeps the message free of Pydantic's "Value error, " prefix
+    @model_validator(mode="after")
+    def check_chunk_parameters(self) -> "ChunkRequest":
+        if not self.text:
+            raise PydanticCustomError("chunk_request", "Text cannot be empty")
+        if self.chunk_size <= 0:
+            raise PydanticCustomError("chunk_request", "Chunk size must be positive")
+        if self.chunk_overlap < 0:
+            raise PydanticCustomError("chunk_request", "Chunk overlap cannot be negative")
+        if self.chunk_overlap >= self.chunk_size:
+            raise PydanticCustomError("chunk_request", "Chunk overlap must be less than chunk size")
+        return self
+
+class BatchChunkRequest(BaseModel):
+    items: List[ChunkRequest]
+    max_concurrency: int = 16
+
+    @model_validator(mode="after")
+    def check_batch_parameters(self) -> "BatchChunkRequest":
+        if len(self.items) > MAX_BATCH_ITEMS:
+            raise PydanticCustomError("batch_chunk_request", f"Batch cannot contain more than {MAX_BATCH_ITEMS} items")
+        if self.max_concurrency <= 0:
+            raise PydanticCustomError("batch_chunk_request", "Max concurrency must be positive")
+        return self
+
 class ChunkData(BaseModel):
     id: int
     text: str
@@ -43,116 +101,130 @@ class DefaultTexts(BaseModel):
     python: str
     markdown: str
 
+def _fast_char_starts(text_length: int, size: int, overlap: int) -> range:
+    """Start offsets of the fixed windows produced by _fast_char_split."""
+    if not text_length:
+        return range(0)
+    # Stop once the remaining tail is already covered by the previous window
+    return range(0, max(text_length - overlap, 1), size - overlap)
+
+def _fast_char_split(text: str, size: int, overlap: int) -> List[str]:
+    """Split text into fixed windows of `size` characters sharing `overlap` characters."""
+    return [text[i:i + size] for i in _fast_char_starts(len(text), size, overlap)]
+
 # Custom text splitters that preserve whitespace (similar to the JS version)
 class CharacterTextSplitterPreserveWhitespace(CharacterTextSplitter):
     def _join_docs(self, docs: List[str], separator: str) -> str:
         # Override to not trim chunks
         return separator.join(docs)
 
+    def split_text(self, text: str) -> List[str]:
+        # An empty separator is a plain sliding window, so slice it directly
+        if self._separator == "":
+            return _fast_char_split(text, self._chunk_size, self._chunk_overlap)
+        return super().split_text(text)
+
+    def split_text_with_starts(self, text: str) -> Tuple[List[str], List[int]]:
+        # Fixed windows start at known offsets, so nothing needs to be searched
+        if self._separator == "":
+            starts = _fast_char_starts(len(text), self._chunk_size, self._chunk_overlap)
+            return [text[i:i + self._chunk_size] for i in starts], list(starts)
+        chunks = self.split_text(text)
+        return chunks, locate_chunks(text, chunks, self._chunk_overlap)
+
 class RecursiveCharacterTextSplitterPreserveWhitespace(RecursiveCharacterTextSplitter):
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        # Compile every separator once instead of on each _split_text call
+        self._compiled_separators: Dict[str, re.Pattern] = {}
+        self._compiled_split_separators: Dict[str, re.Pattern] = {}
+        for separator in self._separators:
+            if not separator:
+                continue
+            pattern = separator if self._is_separator_regex else re.escape(separator)
+            self._compiled_separators[separator] = re.compile(pattern)
+            # The capture group keeps the separators in the split result
+            self._compiled_split_separators[separator] = re.compile(f"({pattern})")
+
     def _join_docs(self, docs: List[str], separator: str) -> str:
         # Override to not trim chunks
         return separator.join(docs)
 
-# Default texts
-DEFAULT_TEXTS = {
-    "prose": """One of the most important things I didn't understand about the world when I was a child is the degree to which the returns for performance are superlinear.
-
-Teachers and coaches implicitly told us the returns were linear. "You get out," I heard a thousand times, "what you put in." They meant well, but this is rarely true. If your product is only half as good as your competitor's, you don't get half as many customers. You get no customers, and you go out of business.
-
-It's obviously true that the returns for performance are superlinear in business. Some think this is a flaw of capitalism, and that if we changed the rules it would stop being true. But superlinear returns for performance are a feature of the world, not an artifact of rules we've invented. We see the same pattern in fame, power, military victories, knowledge, and even benefit to humanity. In all of these, the rich get richer. [1]
-
-You can't understand the world without understanding the concept of superlinear returns. And if you're ambitious you definitely should, because this will be the wave you surf on.
-
-It may seem as if there are a lot of different situations with superlinear returns, but as far as I can tell they reduce to two fundamental causes: exponential growth and thresholds.
-
-The most obvious case of superlinear returns is when you're working on something that grows exponentially. For example, growing bacterial cultures. When they grow at all, they grow exponentially. But they're tricky to grow. Which means the difference in outcome between someone who's adept at it and someone who's not is very great.
-
-Startups can also grow exponentially, and we see the same pattern there. Some manage to achieve high growth rates. Most don't. And as a result you get qualitatively different outcomes: the companies with high growth rates tend to become immensely valuable, while the ones with lower growth rates may not even survive.
-
-Y Combinator encourages founders to focus on growth rate rather than absolute numbers. It prevents them from being discouraged early on, when the absolute numbers are still low. It also helps them decide what to focus on: you can use growth rate as a compass to tell you how to evolve the company. But the main advantage is that by focusing on growth rate you tend to get something that grows exponentially.
-
-YC doesn't explicitly tell founders that with growth rate "you get out what you put in," but it's not far from the truth. And if growth rate were proportional to performance, then the reward for performance p over time t would be proportional to pt.
-
-Even after decades of thinking about this, I find that sentence startling.""",
-    
-    "javascript": '''import { Document } from "langchain/document";
-import { RecursiveCharacterTextSplitter } from "langchain/text_splitter";
-
-const text = "Some other considerations include:
-
-- Do you deploy your backend and frontend together, or separately?
-- Do you deploy your backend co-located with your database, or separately?
-
-**Production Support:** As you move your LangChains into production, we'd love to offer more hands-on support.
-Fill out [this form](https://airtable.com/appwQzlErAS2qiP0L/shrGtGaVBVAz7NcV2) to share more about what you're building, and our team will get in touch.
-
-## Deployment Options
-
-See below for a list of deployment options for your LangChain app. If you don't see your preferred option, please get in touch and we can add it to this list.";
-
-const splitter = new RecursiveCharacterTextSplitter({
-  chunkSize: 50,
-  chunkOverlap: 1,
-  separators: ["|", "##", ">", "-"],
-});
-
-const docOutput = await splitter.splitDocuments([
-  new Document({ pageContent: text }),
-]);
-
-console.log(docOutput);''',
-    
-    "python": '''from operator import itemgetter
-
-from langchain.chat_models import ChatOpenAI
-from langchain.embeddings import OpenAIEmbeddings
-from langchain.prompts import ChatPromptTemplate
-from langchain.schema.output_parser import StrOutputParser
-from langchain.schema.runnable import RunnableLambda, RunnablePassthrough
-from langchain.vectorstores import FAISS
-
-vectorstore = FAISS.from_texts(
-    ["harrison worked at kensho"], embedding=OpenAIEmbeddings()
-)
-retriever = vectorstore.as_retriever()
-
-template = """Answer the question based only on the following context:
-{context}
-
-Question: {question}
-"""
-prompt = ChatPromptTemplate.from_template(template)
-
-model = ChatOpenAI()
-
-chain = (
-    {"context": retriever, "question": RunnablePassthrough()}
-    | prompt
-    | model
-    | StrOutputParser()
-)''',
-    
-    "markdown": '''# Needle In A Haystack - Pressure Testing LLMs
-
-Supported model providers: OpenAI, Anthropic
-
-A simple 'needle in a haystack' analysis to test in-context retrieval ability of long context LLMs.
-
-Get the behind the scenes on the [overview video](https://youtu.be/KwRRuiCCdmc).
-
-![GPT-4-128 Context Testing](img/NeedleHaystackCodeSnippet.png)
-
-git clone https://github.com/gkamradt/LLMTest_NeedleInAHaystack.git
-
-## The Test
-1. Place a random fact or statement (the 'needle') in the middle of a long context window (the 'haystack')
-2. Ask the model to retrieve this statement
-3. Iterate over various document depths (where the needle is placed) and context lengths to measure performance'''
-}
-
+    def split_text_with_starts(self, text: str) -> Tuple[List[str], List[int]]:
+        chunks = self.split_text(text)
+        return chunks, locate_chunks(text, chunks, self._chunk_overlap)
+
+    def _split_on(self, text: str, separator: str) -> List[str]:
+        # Same as LangChain's _split_text_with_regex, using the compiled patterns
+        if not separator:
+            return list(text)
+        if self._keep_separator:
+            _splits = self._compiled_split_separators[separator].split(text)
+            splits = [_splits[i] + _splits[i + 1] for i in range(1, len(_splits), 2)]
+            if len(_splits) % 2 == 0:
+                splits += _splits[-1:]
+            splits = [_splits[0]] + splits
+        else:
+            splits = self._compiled_separators[separator].split(text)
+        return [s for s in splits if s != ""]
+
+    def _split_text(self, text: str, separators: List[str]) -> List[str]:
+        final_chunks = []
+
+        # Pick the first separator that occurs in the text
+        separator = separators[-1]
+        new_separators = []
+        for i, candidate in enumerate(separators):
+            if candidate == "":
+                separator = candidate
+                break
+            if self._compiled_separators[candidate].search(text):
+                separator = candidate
+                new_separators = separators[i + 1:]
+                break
+
+        # Greedily pack small pieces, recursing into pieces that are too large
+        merge_separator = "" if self._keep_separator else separator
+        good_splits = []
+        for piece in self._split_on(text, separator):
+            if self._length_function(piece) < self._chunk_size:
+                good_splits.append(piece)
+                continue
+            if good_splits:
+                final_chunks.extend(self._merge_splits(good_splits, merge_separator))
+                good_splits = []
+            if new_separators:
+                final_chunks.extend(self._split_text(piece, new_separators))
+            else:
+                final_chunks.append(piece)
+
+        if good_splits:
+            final_chunks.extend(self._merge_splits(good_splits, merge_separator))
+
+        return final_chunks
+
+# Default texts live in sidecar files next to this module
+DEFAULT_TEXTS_DIR = Path(__file__).parent / "default_texts"
+DEFAULT_TEXT_NAMES = ("prose", "javascript", "python", "markdown")
+
+@lru_cache(maxsize=None)
+def load_default_texts() -> Dict[str, str]:
+    """Load the default texts from DEFAULT_TEXTS_DIR."""
+    return {
+        name: (DEFAULT_TEXTS_DIR / f"{name}.txt").read_text(encoding="utf-8")
+        for name in DEFAULT_TEXT_NAMES
+    }
+
+# The default texts never change, so validate and serialize them once
+_DEFAULT_TEXTS_BYTES = orjson.dumps(DefaultTexts(**load_default_texts()).model_dump())
+
+@lru_cache(maxsize=256)
 def create_text_splitter(splitter_type: str, chunk_size: int, chunk_overlap: int, language: Optional[str] = None):
-    """Create the appropriate text splitter based on type and parameters."""
+    """Create the appropriate text splitter based on type and parameters.
+    
+    Splitters only hold separator configuration, so cached instances are
+    safe to share across requests and threads.
+    """
     
     if splitter_type == "character":
         return CharacterTextSplitterPreserveWhitespace(
@@ -180,27 +252,115 @@ def create_text_splitter(splitter_type: str, chunk_size: int, chunk_overlap: int
     else:
         raise ValueError(f"Unknown splitter type: {splitter_type}")
 
-def reconstruct_chunks(chunks: List[str], chunk_overlap: int) -> List[ChunkData]:
-    """Reconstruct chunk data with position information."""
-    chunk_data = []
-    current_start_index = 0
+def _chunk_bounds(starts: List[int], lengths: List[int]) -> Tuple[List[int], List[int]]:
+    """Compute chunk end offsets and the overlap of each chunk with the next one."""
+    start_array = np.fromiter(starts, dtype=np.int64, count=len(starts))
+    end_array = start_array + np.fromiter(lengths, dtype=np.int64, count=len(lengths))
+    overlap_array = np.zeros_like(end_array)
+    np.maximum(end_array[:-1] - start_array[1:], 0, out=overlap_array[:-1])
+    return end_array.tolist(), overlap_array.tolist()
+
+def locate_chunks(source_text: str, chunks: List[str], requested_overlap: int) -> List[int]:
+    """Find the start offset of every chunk in the source text.
+    
+    The splitters keep all whitespace, so their chunks cover the text in order
+    without gaps. The first chunk starts at 0 and the last ends at the end of the
+    text. Each chunk starts after the previous one, at most `requested_overlap`
+    characters before it ends. Those bounds limit each start both from the
+    previous chunk and, through the remaining chunk lengths, from the end of the
+    text. A repeated substring can still fit in several places inside them, so
+    candidates are tried latest first and the search backtracks on a dead end.
+    Whether the remaining chunks fit depends only on where the current one
+    starts, so failed placements are remembered and never retried, which keeps
+    the search polynomial.
+    """
+    if not chunks:
+        return []
     
-    for index, chunk in enumerate(chunks):
-        is_last_chunk = index == len(chunks) - 1
-        start_index = current_start_index
-        end_index = start_index + len(chunk)
+    # Range of starts from which the remaining chunks can still end exactly at
+    # the end of the text, given how far each chunk may advance past the previous
+    earliest = [0] * len(chunks)
+    latest = [0] * len(chunks)
+    earliest[-1] = latest[-1] = len(source_text) - len(chunks[-1])
+    for index in range(len(chunks) - 2, -1, -1):
+        chunk_length = len(chunks[index])
+        earliest[index] = earliest[index + 1] - chunk_length
+        latest[index] = latest[index + 1] - max(1, chunk_length - requested_overlap)
+    
+    starts: List[int] = []
+    failed: Set[Tuple[int, int]] = set()
+    # Exclusive end of the rfind window; None starts a fresh search for the chunk
+    search_end = None
+    
+    while len(starts) < len(chunks):
+        index = len(starts)
+        chunk = chunks[index]
+        if index == 0:
+            lowest = highest = 0
+        else:
+            previous_start = starts[-1]
+            previous_end = previous_start + len(chunks[index - 1])
+            lowest = max(previous_start + 1, previous_end - requested_overlap)
+            highest = previous_end
+        lowest = max(lowest, earliest[index])
+        highest = min(highest, latest[index])
+        if search_end is None:
+            search_end = highest + len(chunk)
         
-        chunk_data.append(ChunkData(
-            id=index + 1,
+        position = source_text.rfind(chunk, lowest, search_end) if lowest <= highest else -1
+        while position != -1 and (index, position) in failed:
+            position = source_text.rfind(chunk, lowest, position + len(chunk) - 1)
+        if position != -1:
+            starts.append(position)
+            search_end = None
+            continue
+        
+        # No placement left for this chunk: retry the previous one further left
+        if not starts:
+            raise RuntimeError("Could not locate the chunks in the source text")
+        previous_position = starts.pop()
+        failed.add((index - 1, previous_position))
+        search_end = previous_position + len(chunks[index - 1]) - 1
+    
+    return starts
+
+def chunk_rows(chunks: List[str], starts: List[int]) -> Iterator[Tuple[int, str, int, int, int]]:
+    """Yield (id, text, start, end, overlap with next) for each located chunk.
+    
+    Shared by the JSON and NDJSON responses so their positions always agree.
+    """
+    # Ends and real overlaps are vectorized once all starts are known
+    ends, overlaps = _chunk_bounds(starts, [len(chunk) for chunk in chunks])
+    return zip(itertools.count(1), chunks, starts, ends, overlaps)
+
+def reconstruct_chunks(chunks: List[str], starts: List[int]) -> Tuple[List[ChunkData], int]:
+    """Reconstruct chunk data from the chunks and their start offsets.
+    
+    Returns the chunk data together with the total number of chunk characters.
+    """
+    
+    total_chars = sum(len(chunk) for chunk in chunks)
+    
+    # Values are computed here, so skip Pydantic validation. Both /chunk and
+    # /chunk_batch return pre-serialized bytes, so response_model does not
+    # re-check them either; tests/test_reconstruct.py covers these values.
+    chunk_data = [
+        ChunkData.model_construct(
+            id=index,
             text=chunk,
             start_index=start_index,
             end_index=end_index,
-            overlap_with_next=chunk_overlap if not is_last_chunk else 0
-        ))
-        
-        current_start_index = end_index - (0 if is_last_chunk else chunk_overlap)
+            overlap_with_next=overlap
+        )
+        for index, chunk, start_index, end_index, overlap in chunk_rows(chunks, starts)
+    ]
     
-    return chunk_data
+    return chunk_data, total_chars
+
+@app.exception_handler(ValueError)
+async def value_error_handler(request: Request, exc: ValueError):
+    """Report bad splitter parameters (unknown type or language) as a 400."""
+    return ORJSONResponse({"detail": f"Error chunking text: {exc}"}, status_code=400)
 
 @app.get("/")
 async def root():
@@ -209,63 +369,122 @@ async def root():
 @app.get("/default-texts", response_model=DefaultTexts)
 async def get_default_texts():
     """Get default texts for different content types."""
-    return DefaultTexts(
-        prose=DEFAULT_TEXTS["prose"],
-        javascript=DEFAULT_TEXTS["javascript"],
-        python=DEFAULT_TEXTS["python"],
-        markdown=DEFAULT_TEXTS["markdown"]
+    return Response(content=_DEFAULT_TEXTS_BYTES, media_type="application/json")
+
+def split_request(request: ChunkRequest) -> Tuple[List[str], List[int]]:
+    """Split the request text and locate its chunks."""
+    # Requests sharing parameters reuse the same splitter instance
+    splitter = create_text_splitter(
+        request.splitter_type,
+        request.chunk_size,
+        request.chunk_overlap,
+        request.language
+    )
+    return splitter.split_text_with_starts(request.text)
+
+def build_chunk_response(request: ChunkRequest) -> ChunkResponse:
+    """Split the request text and build the chunk response."""
+    
+    chunks, starts = split_request(request)
+    
+    # Reconstruct chunk data with positions
+    chunk_data, total_chars = reconstruct_chunks(chunks, starts)
+    
+    # Calculate statistics
+    num_chunks = len(chunk_data)
+    avg_chunk_size = total_chars / num_chunks if num_chunks > 0 else 0
+    
+    return ChunkResponse(
+        chunks=chunk_data,
+        total_characters=total_chars,
+        num_chunks=num_chunks,
+        average_chunk_size=avg_chunk_size
     )
 
+def serialize_chunk_response(request: ChunkRequest) -> bytes:
+    """Chunk the request text and serialize the response to JSON."""
+    return orjson.dumps(build_chunk_response(request).model_dump())
+
+async def run_in_pool(func, *args):
+    """Run CPU-bound chunking work on the thread pool so the event loop is not blocked."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(SPLIT_POOL, func, *args)
+
+def cache_response(cache_key: Tuple[Any, ...], content: bytes):
+    """Store a serialized response, evicting least recently used entries past the limits."""
+    global _response_cache_bytes
+    
+    if len(content) > RESPONSE_CACHE_MAX_ENTRY_BYTES:
+        return
+    
+    previous = _response_cache.pop(cache_key, None)
+    if previous is not None:
+        _response_cache_bytes -= len(previous)
+    _response_cache[cache_key] = content
+    _response_cache_bytes += len(content)
+    
+    while len(_response_cache) > RESPONSE_CACHE_SIZE or _response_cache_bytes > RESPONSE_CACHE_MAX_BYTES:
+        _, evicted = _response_cache.popitem(last=False)
+        _response_cache_bytes -= len(evicted)
+
 @app.post("/chunk", response_model=ChunkResponse)
 async def chunk_text(request: ChunkRequest):
     """Chunk text using the specified splitter and parameters."""
     
-    if not request.text:
-        raise HTTPException(status_code=400, detail="Text cannot be empty")
+    cache_key = (
+        xxhash.xxh64_intdigest(request.text.encode("utf-8")),
+        len(request.text),
+        request.chunk_size,
+        request.chunk_overlap,
+        request.splitter_type,
+        request.language
+    )
+    cached = _response_cache.get(cache_key)
+    if cached is not None:
+        _response_cache.move_to_end(cache_key)
+        return Response(content=cached, media_type="application/json")
     
-    if request.chunk_size <= 0:
-        raise HTTPException(status_code=400, detail="Chunk size must be positive")
+    # Splitting, reconstruction and serialization all run off the event loop
+    content = await run_in_pool(serialize_chunk_response, request)
+    cache_response(cache_key, content)
     
-    if request.chunk_overlap < 0:
-        raise HTTPException(status_code=400, detail="Chunk overlap cannot be negative")
+    return Response(content=content, media_type="application/json")
+
+def _ndjson_iter(chunks: List[str], starts: List[int]) -> Iterator[bytes]:
+    """Yield one NDJSON line per chunk, building each line only when it is written.
     
-    if request.chunk_overlap >= request.chunk_size:
-        raise HTTPException(status_code=400, detail="Chunk overlap must be less than chunk size")
+    This is a plain generator, so Starlette advances it on a worker thread.
+    """
+    for index, chunk, start_index, end_index, overlap in chunk_rows(chunks, starts):
+        yield orjson.dumps({"chunk": {
+            "id": index,
+            "text": chunk,
+            "start_index": start_index,
+            "end_index": end_index,
+            "overlap_with_next": overlap
+        }}) + b"\n"
+
+@app.post("/chunk/stream")
+async def chunk_text_stream(request: ChunkRequest):
+    """Chunk text and stream the chunks back as newline-delimited JSON."""
     
-    try:
-        # Create text splitter
-        splitter = create_text_splitter(
-            request.splitter_type, 
-            request.chunk_size, 
-            request.chunk_overlap, 
-            request.language
-        )
-        
-        # Create documents and split
-        from langchain.schema import Document
-        docs = [Document(page_content=request.text)]
-        split_docs = splitter.split_documents(docs)
-        
-        # Extract text from documents
-        chunks = [doc.page_content for doc in split_docs]
-        
-        # Reconstruct chunk data with positions
-        chunk_data = reconstruct_chunks(chunks, request.chunk_overlap)
-        
-        # Calculate statistics
-        total_chars = sum(len(chunk.text) for chunk in chunk_data)
-        num_chunks = len(chunk_data)
-        avg_chunk_size = total_chars / num_chunks if num_chunks > 0 else 0
-        
-        return ChunkResponse(
-            chunks=chunk_data,
-            total_characters=total_chars,
-            num_chunks=num_chunks,
-            average_chunk_size=avg_chunk_size
-        )
-        
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"Error chunking text: {str(e)}")
+    chunks, starts = await run_in_pool(split_request, request)
+    
+    return StreamingResponse(_ndjson_iter(chunks, starts), media_type="application/x-ndjson")
+
+@app.post("/chunk_batch", response_model=List[ChunkResponse])
+async def chunk_batch(request: BatchChunkRequest):
+    """Chunk several texts in one call, at most max_concurrency at a time."""
+    
+    semaphore = asyncio.Semaphore(request.max_concurrency)
+    
+    async def process(item: ChunkRequest) -> bytes:
+        async with semaphore:
+            return await run_in_pool(serialize_chunk_response, item)
+    
+    # Items are serialized on the pool, so only the JSON array is joined here
+    contents = await asyncio.gather(*(process(item) for item in request.items))
+    return Response(content=b"[" + b",".join(contents) + b"]", media_type="application/json")
 
 @app.get("/health")
 async def health_check():
@@ -273,4 +492,20 @@ async def health_check():
     return {"status": "healthy"}
 
 if __name__ == "__main__":
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    parser = argparse.ArgumentParser(description="Run the Chunk2Viz API server under gunicorn")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="Number of gunicorn worker processes")
+    args = parser.parse_args()
+
+    # Run gunicorn as a module of this interpreter from the backend directory,
+    # so it works without an activated venv and from any working directory.
+    # --preload imports the app once in the master so module-level state
+    # (default texts, splitter cache) is shared copy-on-write by the workers.
+    os.execv(sys.executable, [
+        sys.executable, "-m", "gunicorn",
+        "--chdir", str(Path(__file__).resolve().parent),
+        "-k", "uvicorn.workers.UvicornWorker",
+        "-w", str(args.workers),
+        "-b", "0.0.0.0:8000",
+        "--preload",
+        "main:app",
+    ])
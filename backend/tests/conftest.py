@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# Tests import the backend as a top-level module, the same way uvicorn/gunicorn load "main:app"
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
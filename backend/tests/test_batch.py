@@ -0,0 +1,17 @@
+from fastapi.testclient import TestClient
+
+import main
+
+
+client = TestClient(main.app)
+
+
+def test_batch_items_match_individual_chunk_responses():
+    text = main.load_default_texts()["python"]
+    items = [
+        {"text": text, "chunk_size": 60, "chunk_overlap": 20, "splitter_type": "recursive", "language": "python"},
+        {"text": text[:500], "chunk_size": 25, "chunk_overlap": 5, "splitter_type": "character"},
+    ]
+    response = client.post("/chunk_batch", json={"items": items, "max_concurrency": 2})
+    assert response.status_code == 200
+    assert response.json() == [client.post("/chunk", json=item).json() for item in items]
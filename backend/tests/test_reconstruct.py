@@ -0,0 +1,105 @@
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+SPLITTERS = [("character", None), ("recursive", None), ("recursive", "python"), ("recursive", "js"), ("recursive", "markdown")]
+
+
+# Long runs of one character, where a chunk string fits in many places
+REPETITIVE_TEXTS = [
+    "a" * 2000,
+    "-" * 1000,
+    "word" + " " * 300 + "word",
+    "a" + "\n" * 300 + "b",
+    "def f():\n" + "        x = 1\n" * 50,
+    ("=" * 40 + "\n\n") * 30,
+]
+
+
+def chunk_data_for(text, splitter_type, size, overlap, language=None):
+    splitter = main.create_text_splitter(splitter_type, size, overlap, language)
+    chunks, starts = splitter.split_text_with_starts(text)
+    return main.reconstruct_chunks(chunks, starts)
+
+
+def assert_contiguous(text, chunk_data):
+    assert chunk_data[0].start_index == 0
+    assert chunk_data[-1].end_index == len(text)
+    for chunk, next_chunk in zip(chunk_data, chunk_data[1:] + [None]):
+        assert text[chunk.start_index:chunk.end_index] == chunk.text
+        if next_chunk is None:
+            assert chunk.overlap_with_next == 0
+        else:
+            assert chunk.start_index < next_chunk.start_index <= chunk.end_index
+            assert chunk.overlap_with_next == chunk.end_index - next_chunk.start_index
+
+
+@pytest.mark.parametrize("splitter_type,language", SPLITTERS)
+@pytest.mark.parametrize("size", [1, 7, 20, 50, 100, 400])
+def test_offsets_cover_default_texts(splitter_type, language, size):
+    for text in main.load_default_texts().values():
+        for overlap in sorted({0, 1, size // 4, size // 2, size - 1}):
+            if overlap >= size:
+                continue
+            chunk_data, total_chars = chunk_data_for(text, splitter_type, size, overlap, language)
+            assert total_chars == sum(len(chunk.text) for chunk in chunk_data)
+            assert_contiguous(text, chunk_data)
+
+
+@pytest.mark.parametrize("splitter_type,language", SPLITTERS)
+@pytest.mark.parametrize("size,overlap", [(10, 5), (30, 15), (50, 25), (50, 49), (100, 10)])
+def test_offsets_cover_repetitive_texts(splitter_type, language, size, overlap):
+    for text in REPETITIVE_TEXTS:
+        chunk_data, _ = chunk_data_for(text, splitter_type, size, overlap, language)
+        assert_contiguous(text, chunk_data)
+
+
+@pytest.mark.parametrize("size,overlap", [(10, 5), (50, 25), (50, 49)])
+def test_search_handles_repetitive_character_chunks(size, overlap):
+    # The character splitter reports its own offsets; exercise the generic search on its chunks too
+    for text in REPETITIVE_TEXTS:
+        chunks = main.create_text_splitter("character", size, overlap, None).split_text(text)
+        chunk_data, _ = main.reconstruct_chunks(chunks, main.locate_chunks(text, chunks, overlap))
+        assert_contiguous(text, chunk_data)
+
+
+def test_character_starts_are_window_offsets():
+    chunk_data, _ = chunk_data_for("-" * 100, "character", 10, 5)
+    assert [chunk.start_index for chunk in chunk_data] == list(range(0, 95, 5))
+    assert {chunk.overlap_with_next for chunk in chunk_data[:-1]} == {5}
+
+
+def test_repetitive_chunk_request_returns():
+    body = {"text": "-" * 100, "chunk_size": 10, "chunk_overlap": 5, "splitter_type": "character"}
+    response = TestClient(main.app).post("/chunk", json=body)
+    assert response.status_code == 200
+    assert response.json()["num_chunks"] == 19
+
+
+def test_repeated_newline_is_placed_after_previous_chunk():
+    text = main.load_default_texts()["markdown"]
+    chunk_data, _ = chunk_data_for(text, "recursive", 100, 50)
+    # Chunk 2 is a lone "\n"; an earlier "\n" inside chunk 1 must not be picked
+    assert chunk_data[1].text == "\n"
+    assert (chunk_data[0].end_index, chunk_data[1].start_index, chunk_data[1].end_index) == (92, 92, 93)
+    assert chunk_data[0].overlap_with_next == 0
+    assert chunk_data[2].start_index == 93
+
+
+def test_unplaceable_chunks_raise():
+    with pytest.raises(RuntimeError):
+        main.locate_chunks("abc", ["abc", "x"], 0)
+
+
+@pytest.mark.parametrize("text", [main.load_default_texts()["python"], REPETITIVE_TEXTS[4]])
+def test_stream_lines_match_chunk_endpoint(text):
+    client = TestClient(main.app)
+    body = {"text": text, "chunk_size": 60, "chunk_overlap": 20, "splitter_type": "recursive", "language": "python"}
+    response = client.post("/chunk/stream", json=body)
+    assert response.headers["content-type"] == "application/x-ndjson"
+
+    streamed = [orjson.loads(line)["chunk"] for line in response.text.splitlines()]
+    assert streamed == client.post("/chunk", json=body).json()["chunks"]
@@ -0,0 +1,41 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+@pytest.fixture(autouse=True)
+def empty_cache(monkeypatch):
+    monkeypatch.setattr(main, "_response_cache", main.OrderedDict())
+    monkeypatch.setattr(main, "_response_cache_bytes", 0)
+
+
+def chunk(client, **overrides):
+    body = {"text": "hello world " * 30, "chunk_size": 25, "chunk_overlap": 5, "splitter_type": "recursive", **overrides}
+    return client.post("/chunk", json=body)
+
+
+def test_repeated_request_is_served_from_cache():
+    client = TestClient(main.app)
+    first = chunk(client)
+    assert len(main._response_cache) == 1
+    assert chunk(client).content == first.content
+    assert main._response_cache_bytes == len(first.content)
+
+
+def test_oversized_responses_are_not_cached(monkeypatch):
+    monkeypatch.setattr(main, "RESPONSE_CACHE_MAX_ENTRY_BYTES", 100)
+    chunk(TestClient(main.app))
+    assert len(main._response_cache) == 0
+    assert main._response_cache_bytes == 0
+
+
+def test_total_bytes_budget_evicts_oldest(monkeypatch):
+    client = TestClient(main.app)
+    size = len(chunk(client).content)
+    monkeypatch.setattr(main, "RESPONSE_CACHE_MAX_BYTES", 2 * size + size // 2)
+    for chunk_size in (26, 27):
+        chunk(client, chunk_size=chunk_size)
+    assert len(main._response_cache) == 2
+    assert main._response_cache_bytes <= main.RESPONSE_CACHE_MAX_BYTES
+    assert main._response_cache_bytes == sum(len(content) for content in main._response_cache.values())
@@ -0,0 +1,52 @@
+import random
+
+import pytest
+from langchain.text_splitter import Language, RecursiveCharacterTextSplitter
+
+import main
+
+
+class StockRecursiveSplitter(RecursiveCharacterTextSplitter):
+    """LangChain's recursive splitter with the same whitespace-preserving join."""
+
+    def _join_docs(self, docs, separator):
+        return separator.join(docs)
+
+
+def random_texts(alphabet, count, max_length, seed):
+    rnd = random.Random(seed)
+    return ["".join(rnd.choice(alphabet) for _ in range(rnd.randint(1, max_length))) for _ in range(count)]
+
+
+SIZES_AND_OVERLAPS = [(size, overlap) for size in (1, 2, 5, 13, 50, 100, 333) for overlap in sorted({0, 1, size // 3, size - 1}) if overlap < size]
+
+
+@pytest.mark.parametrize("size,overlap", SIZES_AND_OVERLAPS)
+def test_recursive_matches_langchain(size, overlap):
+    texts = list(main.load_default_texts().values()) + random_texts("ab \n\n", 30, 400, seed=0)
+    splitter = main.create_text_splitter("recursive", size, overlap, None)
+    stock = StockRecursiveSplitter(chunk_size=size, chunk_overlap=overlap, keep_separator=True)
+    for text in texts:
+        assert splitter.split_text(text) == stock.split_text(text)
+
+
+def test_recursive_overlapping_separators_match_langchain():
+    separators = ["aba", "aa", "ba", "a", "b", ""]
+    for text in random_texts("ab", 200, 120, seed=1):
+        for size, overlap in ((2, 0), (5, 1), (11, 5)):
+            ours = main.RecursiveCharacterTextSplitterPreserveWhitespace(
+                separators=separators, chunk_size=size, chunk_overlap=overlap
+            )
+            stock = StockRecursiveSplitter(separators=separators, chunk_size=size, chunk_overlap=overlap)
+            assert ours.split_text(text) == stock.split_text(text)
+
+
+@pytest.mark.parametrize("language", [language.value for language in Language])
+@pytest.mark.parametrize("keep_separator", [True, False])
+def test_language_splitters_match_langchain(language, keep_separator):
+    for text in main.load_default_texts().values():
+        for size in (5, 20, 100, 400):
+            for overlap in (0, 2, size // 2):
+                kwargs = dict(language=language, chunk_size=size, chunk_overlap=overlap, keep_separator=keep_separator)
+                ours = main.RecursiveCharacterTextSplitterPreserveWhitespace.from_language(**kwargs)
+                assert ours.split_text(text) == StockRecursiveSplitter.from_language(**kwargs).split_text(text)
@@ -0,0 +1,33 @@
+import pytest
+from fastapi.testclient import TestClient
+
+import main
+
+
+client = TestClient(main.app)
+
+
+@pytest.mark.parametrize("overrides,message", [
+    ({"text": ""}, "Text cannot be empty"),
+    ({"chunk_size": 0}, "Chunk size must be positive"),
+    ({"chunk_overlap": -1}, "Chunk overlap cannot be negative"),
+    ({"chunk_overlap": 10}, "Chunk overlap must be less than chunk size"),
+])
+def test_invalid_chunk_request_reports_plain_message(overrides, message):
+    body = {"text": "some text", "chunk_size": 10, "chunk_overlap": 0, "splitter_type": "character", **overrides}
+    response = client.post("/chunk", json=body)
+    assert response.status_code == 422
+    assert [error["msg"] for error in response.json()["detail"]] == [message]
+
+
+def test_invalid_batch_concurrency_reports_plain_message():
+    response = client.post("/chunk_batch", json={"items": [], "max_concurrency": 0})
+    assert response.status_code == 422
+    assert [error["msg"] for error in response.json()["detail"]] == ["Max concurrency must be positive"]
+
+
+def test_oversized_batch_reports_plain_message():
+    item = {"text": "some text", "chunk_size": 10, "chunk_overlap": 0, "splitter_type": "character"}
+    response = client.post("/chunk_batch", json={"items": [item] * (main.MAX_BATCH_ITEMS + 1)})
+    assert response.status_code == 422
+    assert [error["msg"] for error in response.json()["detail"]] == [f"Batch cannot contain more than {main.MAX_BATCH_ITEMS} items"]
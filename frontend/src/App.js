@@ -192,7 +192,11 @@ function App() {
 
       if (!response.ok) {
         const errorData = await response.json();
-        throw new Error(errorData.detail || 'Failed to chunk text');
+        // Validation errors (422) carry a list of messages instead of a string
+        const detail = Array.isArray(errorData.detail)
+          ? errorData.detail.map((item) => item.msg).join('; ')
+          : errorData.detail;
+        throw new Error(detail || 'Failed to chunk text');
       }
 
       const data = await response.json();